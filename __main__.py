@@ -4,12 +4,28 @@ fastmcp-server-collection - Run FastMCP servers
 """
 
 import argparse
-import sys
+import importlib
+import logging
+import os
+
+# Static dispatch table: server name -> (module, attribute holding the
+# FastMCP instance). One dict lookup resolves the target, and argparse can
+# reject unknown names before any server module is imported.
+_SERVERS = {
+  "skyvern": ("servers.skyvern", "mcp"),
+  "skyvern_openapi": ("servers.skyvern_openapi", "mcp"),
+}
 
 if __name__ == "__main__":
   parser = argparse.ArgumentParser(description="Run FastMCP servers")
-  parser.add_argument("-s", "--server", required=True, help="Server to run")
+  parser.add_argument(
+    "-s", "--server", required=True, choices=sorted(_SERVERS), help="Server to run"
+  )
   args = parser.parse_args()
-  
+
+  logging.basicConfig(level=os.getenv("LOGLEVEL", "INFO"))
+
   print(f"Starting {args.server} server...")
-  # TODO: Implement server loading logic
+  module_name, attr = _SERVERS[args.server]
+  server = getattr(importlib.import_module(module_name), attr)
+  server.run()
@@ -1,15 +1,25 @@
 import asyncio
 import httpx
+import logging
+import orjson
 import os
+import random
+import sqlite3
+import time
 
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from typing import Any, Dict, Annotated, Literal
-from pydantic import Field
+from cachetools import TTLCache
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
 
 # Load .env
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 skyvern_url = os.getenv("SKYVERN_URL")
 skyvern_api_key = os.getenv("SKYVERN_API_KEY")
 
@@ -19,12 +29,360 @@ if not skyvern_url:
 if not skyvern_api_key:
     raise ValueError("SKYVERN_API_KEY environment variable is not set")
 
-# Create the MCP server
-mcp = FastMCP("skyvern")
-
 # Constants
 USER_AGENT = "fastmcp-server-collection/1.0"
 
+# API paths, relative to the client's base_url.
+TASKS_PATH = "/v1/run/tasks"
+RUN_PATH = "/v1/runs/{run_id}"
+CANCEL_PATH = "/v1/runs/{run_id}/cancel"
+
+# Transient statuses worth retrying; everything else fails immediately.
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+MAX_ATTEMPTS = 4
+
+# Task statuses that can no longer change, so their details can be cached long.
+TERMINAL_STATUSES = frozenset({"completed", "failed", "terminated", "canceled", "timed_out"})
+
+# Polling loops re-fetch the same run_id many times while a task runs; serve
+# repeats from memory. In-flight details stay fresh for only a couple of
+# seconds, terminal details for an hour.
+_details_cache: TTLCache = TTLCache(maxsize=4096, ttl=2)
+_terminal_details_cache: TTLCache = TTLCache(maxsize=4096, ttl=3600)
+
+# Optional semantic cache for initiate_task: batch callers often resubmit
+# near-identical prompts that an exact-match cache would miss. Prompts are
+# embedded via a local Ollama model and matched by cosine similarity in a
+# sqlite-vec database. Enabled with SKYVERN_SEMANTIC_CACHE=1; requires the
+# semantic-cache extra and an Ollama instance serving the embedding model.
+_semantic_cache_enabled = os.getenv("SKYVERN_SEMANTIC_CACHE", "").lower() in ("1", "true", "yes")
+try:
+    import sqlite_vec
+except ImportError:
+    sqlite_vec = None
+    _semantic_cache_enabled = False
+if _semantic_cache_enabled and not hasattr(sqlite3.Connection, "enable_load_extension"):
+    logger.warning("sqlite3 was built without extension support; semantic cache disabled")
+    _semantic_cache_enabled = False
+
+SEMANTIC_SIMILARITY_THRESHOLD = 0.95
+_EMBED_MODEL = os.getenv("SKYVERN_EMBED_MODEL", "nomic-embed-text")
+_OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
+_SEMANTIC_CACHE_PATH = os.getenv(
+    "SKYVERN_SEMANTIC_CACHE_PATH",
+    os.path.join(os.path.expanduser("~"), ".cache", "fastmcp", "skyvern_semantic_cache.db"),
+)
+_SEMANTIC_CACHE_TTL = int(os.getenv("SKYVERN_SEMANTIC_CACHE_TTL", "3600"))
+
+_semantic_db: sqlite3.Connection | None = None
+_embed_client: httpx.AsyncClient | None = None
+
+
+def _get_embed_client() -> httpx.AsyncClient:
+    """Returns the pooled client for the local Ollama embedding endpoint."""
+    global _embed_client
+    if _embed_client is None:
+        _embed_client = httpx.AsyncClient(base_url=_OLLAMA_URL, timeout=30.0)
+    return _embed_client
+
+
+def _semantic_cache_db() -> sqlite3.Connection:
+    """Returns the sqlite-vec backed cache database, creating it on first use."""
+    global _semantic_db
+    if _semantic_db is None:
+        os.makedirs(os.path.dirname(_SEMANTIC_CACHE_PATH), exist_ok=True)
+        db = sqlite3.connect(_SEMANTIC_CACHE_PATH)
+        db.enable_load_extension(True)
+        sqlite_vec.load(db)
+        db.enable_load_extension(False)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS task_cache ("
+            " id INTEGER PRIMARY KEY,"
+            " url TEXT NOT NULL,"
+            " embedding BLOB NOT NULL,"
+            " response TEXT NOT NULL,"
+            " created_at REAL NOT NULL)"
+        )
+        _semantic_db = db
+    return _semantic_db
+
+
+async def _embed_prompt(prompt: str) -> bytes | None:
+    """Embeds a prompt via Ollama; returns None (cache miss) on any failure."""
+    try:
+        response = await _get_embed_client().post(
+            "/api/embeddings",
+            content=orjson.dumps({"model": _EMBED_MODEL, "prompt": prompt}),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        return sqlite_vec.serialize_float32(orjson.loads(response.content)["embedding"])
+    except (httpx.HTTPError, KeyError, orjson.JSONDecodeError) as e:
+        logger.warning("Semantic cache embedding failed, bypassing cache: %s", e)
+        return None
+
+
+def _semantic_cache_lookup(url: str, embedding: bytes) -> Dict[str, Any] | None:
+    """Returns a cached response for a near-duplicate prompt on the same URL."""
+    try:
+        row = _semantic_cache_db().execute(
+            "SELECT response, vec_distance_cosine(embedding, ?) AS dist"
+            " FROM task_cache WHERE url = ? AND created_at > ?"
+            " ORDER BY dist LIMIT 1",
+            (embedding, url, time.time() - _SEMANTIC_CACHE_TTL),
+        ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning("Semantic cache lookup failed: %s", e)
+        return None
+    if row is not None and 1.0 - row[1] >= SEMANTIC_SIMILARITY_THRESHOLD:
+        return orjson.loads(row[0])
+    return None
+
+
+def _semantic_cache_store(url: str, embedding: bytes, response: Dict[str, Any]) -> None:
+    """Records a successful initiation so near-duplicates can reuse it."""
+    try:
+        db = _semantic_cache_db()
+        db.execute(
+            "INSERT INTO task_cache (url, embedding, response, created_at)"
+            " VALUES (?, ?, ?, ?)",
+            (url, embedding, orjson.dumps(response), time.time()),
+        )
+        db.commit()
+    except sqlite3.Error as e:
+        logger.warning("Semantic cache store failed: %s", e)
+
+# Shared client for the Skyvern API. A single client keeps the connection
+# pool alive across tool invocations, so repeated calls reuse existing
+# TCP/TLS connections instead of paying a fresh handshake each time. It is
+# created by the server lifespan (inside the server's event loop, so the
+# pool is bound to the loop that all tool calls run on) and closed there.
+_client: httpx.AsyncClient | None = None
+
+
+def _build_client() -> httpx.AsyncClient:
+    """Builds the shared Skyvern API client."""
+    return httpx.AsyncClient(
+        base_url=skyvern_url,
+        headers={
+            "x-api-key": skyvern_api_key,
+            "User-Agent": USER_AGENT,
+        },
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=20, keepalive_expiry=30
+        ),
+        timeout=30.0,
+        http2=True,
+    )
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Returns the shared client, creating it if the lifespan hasn't yet."""
+    global _client
+    if _client is None:
+        _client = _build_client()
+    return _client
+
+# Cap concurrent outbound requests so a batch caller can't flood the Skyvern
+# API and trip its rate limits. Tunable via SKYVERN_MAX_CONCURRENCY.
+_request_semaphore = asyncio.BoundedSemaphore(
+    int(os.getenv("SKYVERN_MAX_CONCURRENCY", "16"))
+)
+
+
+@dataclass
+class _RateState:
+    """Rate-limit bookkeeping from the most recent Skyvern response headers."""
+    remaining: int | None = None
+    reset_at: float | None = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+_rate_state = _RateState()
+
+# Start pacing requests once the reported remaining quota drops below this.
+_RATE_LIMIT_THRESHOLD = int(os.getenv("SKYVERN_RATE_LIMIT_THRESHOLD", "4"))
+
+
+async def _pace_for_rate_limit() -> None:
+    """Sleeps briefly before dispatch when the remaining quota is nearly spent."""
+    async with _rate_state.lock:
+        remaining = _rate_state.remaining
+        reset_at = _rate_state.reset_at
+    if remaining is None or reset_at is None or remaining >= _RATE_LIMIT_THRESHOLD:
+        return
+    reset_in = reset_at - time.time()
+    if reset_in > 0:
+        await asyncio.sleep(min(30.0, reset_in / max(1, remaining)))
+
+
+async def _record_rate_limit(response: httpx.Response) -> None:
+    """Captures x-ratelimit-* headers so the next dispatch can pace itself."""
+    remaining = response.headers.get("x-ratelimit-remaining")
+    reset = response.headers.get("x-ratelimit-reset")
+    if remaining is None or reset is None:
+        return
+    try:
+        remaining_count = int(remaining)
+        reset_value = float(reset)
+    except ValueError:
+        return
+    # The reset header may be epoch seconds or seconds-until-reset; treat
+    # anything shorter than a day as a relative value.
+    reset_at = time.time() + reset_value if reset_value < 86400 else reset_value
+    async with _rate_state.lock:
+        _rate_state.remaining = remaining_count
+        _rate_state.reset_at = reset_at
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP):
+    """Server lifespan: own the shared HTTP clients for the server's loop."""
+    global _client, _embed_client
+    _client = _build_client()
+    try:
+        yield
+    finally:
+        await _client.aclose()
+        _client = None
+        if _embed_client is not None:
+            await _embed_client.aclose()
+            _embed_client = None
+
+
+# Create the MCP server
+mcp = FastMCP("skyvern", lifespan=_lifespan)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Computes the backoff delay before retrying a transient failure.
+
+    Honors the Retry-After header when the server sends one; otherwise uses
+    exponential backoff (capped at 30s) with a small random jitter.
+    """
+    retry_after = response.headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return min(30.0, float(retry_after))
+        except ValueError:
+            pass
+    return min(30.0, 0.5 * 2 ** attempt) + random.random() * 0.1
+
+
+async def _skyvern_request(
+    method: str,
+    path: str,
+    *,
+    json: Dict[str, Any] | None = None,
+    label: str,
+    **path_args: str,
+) -> Dict[str, Any]:
+    """
+    Sends a request to the Skyvern API and maps failures to structured errors.
+
+    Args:
+        method: The HTTP method to use.
+        path: The API path template, relative to the client's base URL.
+        json: Optional JSON body for the request.
+        label: Human-readable description of the operation, used in error messages.
+        **path_args: Values interpolated into the path template.
+
+    Returns:
+        The decoded JSON response, or a structured error dictionary.
+
+    Transient failures (429 and common 5xx statuses) are retried with
+    exponential backoff before being reported as errors.
+    """
+    if path_args:
+        path = path.format(**path_args)
+    # Encode the body once with orjson (2-5x faster than stdlib json for the
+    # large payloads Skyvern deals in), and reuse it across retries.
+    if json is not None:
+        body = orjson.dumps(json)
+        headers = {"Content-Type": "application/json"}
+    else:
+        body = None
+        headers = None
+    try:
+        for attempt in range(MAX_ATTEMPTS):
+            async with _request_semaphore:
+                await _pace_for_rate_limit()
+                # Stream the body chunk-by-chunk instead of letting httpx
+                # buffer it internally first; task details can embed
+                # multi-megabyte step traces and extraction results.
+                async with _get_client().stream(
+                    method, path, content=body, headers=headers
+                ) as response:
+                    if not response.is_success:
+                        # Buffer any non-2xx body (including 3xx, which
+                        # raise_for_status also rejects) so the error
+                        # handler can read response.text.
+                        await response.aread()
+                        chunks = []
+                    else:
+                        chunks = [chunk async for chunk in response.aiter_bytes()]
+            await _record_rate_limit(response)
+            if (
+                response.status_code in RETRYABLE_STATUS_CODES
+                and attempt < MAX_ATTEMPTS - 1
+            ):
+                await asyncio.sleep(_retry_delay(response, attempt))
+                continue
+            response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
+            return orjson.loads(b"".join(chunks))
+    except httpx.HTTPStatusError as e:
+        # Lazy %-formatting: the (potentially large) response text is only
+        # stringified when an ERROR-level handler is actually enabled.
+        logger.error(
+            "Skyvern API HTTPStatusError: %s - %s",
+            e.response.status_code, e.response.text,
+        )
+        return {
+            "error": "SkyvernAPIError",
+            "message": f"Skyvern API request failed with status {e.response.status_code}",
+            "details": e.response.text,
+            "status_code": e.response.status_code
+        }
+    except httpx.RequestError as e:
+        logger.error("Skyvern API RequestError: %s", e)
+        return {
+            "error": "NetworkError",
+            "message": "Failed to connect to Skyvern API or other network issue.",
+            "details": str(e)
+        }
+    except Exception as e:  # Catch any other unexpected errors
+        logger.error("Unexpected error during Skyvern API call: %s", e)
+        return {
+            "error": "InternalServerError",
+            "message": f"An unexpected error occurred while {label}.",
+            "details": str(e)
+        }
+
+
+class InitiateTaskPayload(BaseModel):
+    """Request body for POST /v1/run/tasks.
+
+    Dumping with exclude_none=True drops the unset optional fields in
+    pydantic-core's C layer, replacing the old per-field None checks.
+    """
+    model_config = ConfigDict(extra="forbid")
+
+    url: str
+    prompt: str
+    title: str
+    engine: str
+    proxy_location: str
+    max_steps: int
+    publish_workflow: bool
+    data_extraction_schema: Dict[str, Any] | None = None
+    error_code_mapping: Dict[str, Any] | None = None
+    webhook_url: str | None = None
+    totp_identifier: str | None = None
+    totp_url: str | None = None
+    browser_session_id: str | None = None
+
+
 @mcp.tool()
 async def initiate_task(
     url: Annotated[str, Field(description="The starting URL for the task. If not provided, Skyvern will attempt to determine an appropriate URL.")],
@@ -39,7 +397,8 @@ async def initiate_task(
     totp_identifier: Annotated[str | None, Field(description="Identifier for TOTP (Time-based One-Time Password) authentication if codes are being pushed to Skyvern")] = None,
     totp_url: Annotated[str | None, Field(description="URL for TOTP authentication setup if Skyvern should poll endpoint for 2FA codes")] = None,
     browser_session_id: Annotated[str | None, Field(description="ID of an existing browser session to reuse, having it continue from the current screen state")] = None,
-    publish_workflow: Annotated[bool, Field(description="Whether to publish this task as a reusable workflow. Default is false")] = False
+    publish_workflow: Annotated[bool, Field(description="Whether to publish this task as a reusable workflow. Default is false")] = False,
+    no_cache: Annotated[bool, Field(description="Skip the semantic task cache and always submit a new task. Default is false")] = False
 ) -> Dict[str, Any]:
     """
     Initiates a task with the Skyvern API.
@@ -58,70 +417,84 @@ async def initiate_task(
         totp_url: URL for TOTP authentication setup if Skyvern should poll for 2FA codes.
         browser_session_id: ID of an existing browser session to reuse.
         publish_workflow: Whether to publish this task as a reusable workflow. Default is False.
+        no_cache: Skip the semantic task cache for this submission. Default is False.
 
     Returns:
         A dictionary containing the Skyvern API response or a structured error message.
     """
-    api_url = f"{skyvern_url}/v1/run/tasks"
-    headers = {
-        "x-api-key": skyvern_api_key,
-        "User-Agent": USER_AGENT,
-        "Content-Type": "application/json",
-    }
-    payload = {
-        "url": url,
-        "prompt": prompt,
-        "title": title,
-        "engine": engine,
-        "proxy_location": proxy_location,
-        "max_steps": max_steps,
-        "publish_workflow": publish_workflow,
-    }
-
-    # Add optional parameters only if they're provided
-    if data_extraction_schema is not None:
-        payload["data_extraction_schema"] = data_extraction_schema
-    if error_code_mapping is not None:
-        payload["error_code_mapping"] = error_code_mapping
-    if webhook_url is not None:
-        payload["webhook_url"] = webhook_url
-    if totp_identifier is not None:
-        payload["totp_identifier"] = totp_identifier
-    if totp_url is not None:
-        payload["totp_url"] = totp_url
-    if browser_session_id is not None:
-        payload["browser_session_id"] = browser_session_id
-
-    async with httpx.AsyncClient() as client:
+    embedding = None
+    if _semantic_cache_enabled and not no_cache:
+        embedding = await _embed_prompt(prompt)
+        if embedding is not None:
+            cached = _semantic_cache_lookup(url, embedding)
+            if cached is not None:
+                return cached
+
+    payload = InitiateTaskPayload(
+        url=url,
+        prompt=prompt,
+        title=title,
+        engine=engine,
+        proxy_location=proxy_location,
+        max_steps=max_steps,
+        publish_workflow=publish_workflow,
+        data_extraction_schema=data_extraction_schema,
+        error_code_mapping=error_code_mapping,
+        webhook_url=webhook_url,
+        totp_identifier=totp_identifier,
+        totp_url=totp_url,
+        browser_session_id=browser_session_id,
+    ).model_dump(exclude_none=True)
+
+    result = await _skyvern_request(
+        "POST", TASKS_PATH, json=payload,
+        label="processing the Skyvern task initiation",
+    )
+    if embedding is not None and "error" not in result:
+        _semantic_cache_store(url, embedding, result)
+    return result
+
+@mcp.tool()
+async def initiate_batch(
+    requests: Annotated[list[Dict[str, Any]], Field(description="List of keyword-argument dictionaries for initiate_task, one per task to start.")],
+    max_concurrent: Annotated[int, Field(description="Maximum number of tasks to initiate in parallel. Values below 1 are treated as 1. Default is 10.")] = 10
+) -> list[Dict[str, Any]]:
+    """
+    Initiates multiple tasks with the Skyvern API concurrently.
+
+    Args:
+        requests: A list of keyword-argument dictionaries for initiate_task.
+        max_concurrent: Maximum number of initiations in flight at once.
+            Values below 1 are treated as 1. Default is 10.
+
+    Returns:
+        A list of Skyvern API responses or structured error messages, in the
+        same order as the input requests.
+    """
+    # A local semaphore bounds this batch's fan-out; the module-level
+    # semaphore still caps total outbound concurrency across all callers.
+    # Clamp client-supplied values: 0 would deadlock, negatives would raise.
+    sem = asyncio.BoundedSemaphore(max(1, max_concurrent))
+
+    async def _run(request: Dict[str, Any]) -> Dict[str, Any]:
         try:
-            response = await client.post(api_url, json=payload, headers=headers)
-            response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            # Log or print the error for server-side visibility
-            # In a production app, you'd use a proper logger here.
-            print(f"Skyvern API HTTPStatusError: {e.response.status_code} - {e.response.text}")
-            return {
-                "error": "SkyvernAPIError",
-                "message": f"Skyvern API request failed with status {e.response.status_code}",
-                "details": e.response.text,
-                "status_code": e.response.status_code
-            }
-        except httpx.RequestError as e:
-            print(f"Skyvern API RequestError: {e}")
-            return {
-                "error": "NetworkError",
-                "message": "Failed to connect to Skyvern API or other network issue.",
-                "details": str(e)
-            }
-        except Exception as e: # Catch any other unexpected errors
-            print(f"Unexpected error during Skyvern API call: {e}")
+            async with sem:
+                return await initiate_task(**request)
+        # TypeError covers unknown or missing initiate_task arguments;
+        # ValidationError covers wrong-typed fields rejected by
+        # InitiateTaskPayload. Either way, one bad request must not cancel
+        # its siblings in the TaskGroup.
+        except (TypeError, ValidationError) as e:
             return {
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred while processing the Skyvern task initiation.",
+                "error": "InvalidRequest",
+                "message": "Invalid arguments for initiate_task.",
                 "details": str(e)
             }
 
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_run(request)) for request in requests]
+    return [task.result() for task in tasks]
+
 @mcp.tool()
 async def get_task_details(run_id: str) -> Dict[str, Any]:
     """
@@ -133,39 +506,22 @@ async def get_task_details(run_id: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing the task details or a structured error message.
     """
-    api_url = f"{skyvern_url}/v1/runs/{run_id}"
-    headers = {
-        "x-api-key": skyvern_api_key,
-        "User-Agent": USER_AGENT,
-    }
+    cached = _terminal_details_cache.get(run_id)
+    if cached is None:
+        cached = _details_cache.get(run_id)
+    if cached is not None:
+        return cached
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(api_url, headers=headers)
-            response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            print(f"Skyvern API HTTPStatusError: {e.response.status_code} - {e.response.text}")
-            return {
-                "error": "SkyvernAPIError",
-                "message": f"Skyvern API request failed with status {e.response.status_code}",
-                "details": e.response.text,
-                "status_code": e.response.status_code
-            }
-        except httpx.RequestError as e:
-            print(f"Skyvern API RequestError: {e}")
-            return {
-                "error": "NetworkError",
-                "message": "Failed to connect to Skyvern API or other network issue.",
-                "details": str(e)
-            }
-        except Exception as e:  # Catch any other unexpected errors
-            print(f"Unexpected error during Skyvern API call: {e}")
-            return {
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred while retrieving the Skyvern task details.",
-                "details": str(e)
-            }
+    result = await _skyvern_request(
+        "GET", RUN_PATH, run_id=run_id,
+        label="retrieving the Skyvern task details",
+    )
+    if "error" not in result:
+        if result.get("status") in TERMINAL_STATUSES:
+            _terminal_details_cache[run_id] = result
+        else:
+            _details_cache[run_id] = result
+    return result
 
 @mcp.tool()
 async def cancel_task(run_id: str) -> Dict[str, Any]:
@@ -178,41 +534,17 @@ async def cancel_task(run_id: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing the cancellation response or a structured error message.
     """
-    api_url = f"{skyvern_url}/v1/runs/{run_id}/cancel"
-    headers = {
-        "x-api-key": skyvern_api_key,
-        "User-Agent": USER_AGENT,
-        "Content-Type": "application/json",
-    }
-
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(api_url, headers=headers)
-            response.raise_for_status()  # Raise an exception for bad status codes (4xx or 5xx)
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            print(f"Skyvern API HTTPStatusError: {e.response.status_code} - {e.response.text}")
-            return {
-                "error": "SkyvernAPIError",
-                "message": f"Skyvern API request failed with status {e.response.status_code}",
-                "details": e.response.text,
-                "status_code": e.response.status_code
-            }
-        except httpx.RequestError as e:
-            print(f"Skyvern API RequestError: {e}")
-            return {
-                "error": "NetworkError",
-                "message": "Failed to connect to Skyvern API or other network issue.",
-                "details": str(e)
-            }
-        except Exception as e:  # Catch any other unexpected errors
-            print(f"Unexpected error during Skyvern API call: {e}")
-            return {
-                "error": "InternalServerError",
-                "message": "An unexpected error occurred while canceling the Skyvern task.",
-                "details": str(e)
-            }
+    result = await _skyvern_request(
+        "POST", CANCEL_PATH, run_id=run_id,
+        label="canceling the Skyvern task",
+    )
+    if "error" not in result:
+        # Cached details are stale once the task has been canceled.
+        _details_cache.pop(run_id, None)
+        _terminal_details_cache.pop(run_id, None)
+    return result
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOGLEVEL", "INFO"))
     # Start the MCP server
     mcp.run()
@@ -1,7 +1,10 @@
 import asyncio
 import os
+import time
 import httpx
+import orjson
 
+from pathlib import Path
 from dotenv import load_dotenv
 from fastmcp import FastMCP
 from fastmcp.server.openapi import RouteMap, RouteType
@@ -17,20 +20,78 @@ if not skyvern_url:
 if not skyvern_api_key:
     raise ValueError("SKYVERN_API_KEY environment variable is not set")
 
-# Client for the Skyvern API
+# Client for the Skyvern API. HTTP/2 lets concurrent tool calls multiplex
+# over a single keep-alive connection instead of queueing per socket.
 client = httpx.AsyncClient(
     base_url=skyvern_url,
     headers={
         "x-api-key": skyvern_api_key
-    }
+    },
+    limits=httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30),
+    http2=True,
 )
 
+SPEC_URL = "https://api.skyvern.com/openapi.json"
+SPEC_CACHE_PATH = Path(
+    os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")
+) / "fastmcp" / "skyvern_openapi.json"
+SPEC_CACHE_TTL = 24 * 60 * 60  # refetch the spec at most once a day
+
+
+def _load_spec() -> dict:
+    """
+    Loads the Skyvern OpenAPI spec, preferring a recent on-disk copy.
+
+    The spec rarely changes, so a day-old cache avoids paying an HTTPS
+    round-trip on every cold start and keeps the server bootable while the
+    Skyvern API is unreachable.
+    """
+    try:
+        if time.time() - SPEC_CACHE_PATH.stat().st_mtime < SPEC_CACHE_TTL:
+            return orjson.loads(SPEC_CACHE_PATH.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        pass  # missing or unreadable cache; fall through to a fresh fetch
+
+    spec_response = httpx.get(SPEC_URL)
+    # A 404/503 body parses as JSON just fine; don't build (or worse, cache
+    # for a day) a "spec" from an error response.
+    spec_response.raise_for_status()
+    spec_bytes = spec_response.content
+    spec = orjson.loads(spec_bytes)
+    try:
+        SPEC_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = SPEC_CACHE_PATH.with_suffix(".tmp")
+        tmp_path.write_bytes(spec_bytes)
+        os.replace(tmp_path, SPEC_CACHE_PATH)
+    except OSError:
+        pass  # caching is best-effort; the fetched spec is still usable
+
+    return spec
+
+
+def _build_mcp(spec: dict) -> FastMCP:
+    """Builds the Skyvern MCP server from an OpenAPI spec."""
+    return FastMCP.from_openapi(
+        openapi_spec=spec, client=client, name="Skyvern", route_maps=[
+            RouteMap(methods="*", pattern=r".*", route_type=RouteType.TOOL)
+        ]
+    )
+
+
+async def init_mcp() -> FastMCP:
+    """
+    Builds the server without blocking a running event loop.
+
+    _load_spec can hit the network when the disk cache is stale; offloading
+    it to a worker thread keeps the loop responsive for callers embedding
+    this server inside an existing asyncio application.
+    """
+    spec = await asyncio.to_thread(_load_spec)
+    return _build_mcp(spec)
+
+
 # Create the MCP server
-mcp = FastMCP.from_openapi(
-    openapi_spec=httpx.get("https://api.skyvern.com/openapi.json").json(), client=client, name="Skyvern", route_maps=[
-        RouteMap(methods="*", pattern=r".*", route_type=RouteType.TOOL)
-    ]
-)
+mcp = _build_mcp(_load_spec())
 
 async def check_mcp(mcp: FastMCP):
     # List what components were created
@@ -39,19 +100,22 @@ async def check_mcp(mcp: FastMCP):
     templates = await mcp.get_resource_templates()
 
     print(
-        f"{len(tools)} Tool(s): {', '.join([t.name for t in tools.values() if t.name is not None])}"
+        f"{len(tools)} Tool(s): {', '.join(t.name for t in tools.values() if t.name is not None)}"
     )
     print(
-        f"{len(resources)} Resource(s): {', '.join([r.name for r in resources.values() if r.name is not None])}"
+        f"{len(resources)} Resource(s): {', '.join(r.name for r in resources.values() if r.name is not None)}"
     )
     print(
-        f"{len(templates)} Resource Template(s): {', '.join([t.name for t in templates.values() if t.name is not None])}"
+        f"{len(templates)} Resource Template(s): {', '.join(t.name for t in templates.values() if t.name is not None)}"
     )
 
     return mcp
 
 
 if __name__ == "__main__":
-    asyncio.run(check_mcp(mcp))
+    # Enumerating every tool/resource/template is pure debug output and slows
+    # cold start, so only do it when asked.
+    if os.getenv("FASTMCP_DEBUG"):
+        asyncio.run(check_mcp(mcp))
     # Start the MCP server
     mcp.run()